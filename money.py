@@ -8,63 +8,268 @@ Features:
 - See current balance
 - See full transaction history
 - See monthly summary
+- Export a readable (pretty) JSON copy
 
 Data is stored in 'pocket_data.json' in the same folder.
+New transactions go to 'pocket_data.log' and are merged into it on exit.
+Amounts are stored as whole paise (₹1 = 100).
+Answers can also be piped in, one per line, for batch imports.
 """
 
+import glob
 import json
+import math
+import mmap
 import os
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
 from datetime import datetime
-from typing import Dict, Any, List
+from itertools import compress
+from operator import itemgetter
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+try:
+    import orjson  # optional, makes loading and saving faster
+except ImportError:
+    orjson = None
 
 DATA_FILE = "pocket_data.json"
+LOG_FILE = "pocket_data.log"
+PRETTY_FILE = "pocket_data.pretty.json"
+
+# Every transaction is written with "date", "type" and "amount" keys
+_get_date = itemgetter("date")
+_get_type = itemgetter("type")
+_get_amount = itemgetter("amount")
 
 
 # ---------------------- Data Handling ---------------------- #
 
+def read_json(path: str) -> Any:
+    """Decode a JSON file, memory-mapping it when orjson is available."""
+    with open(path, "rb") as f:
+        if orjson is None:
+            return json.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
 def load_data() -> Dict[str, Any]:
-    """Load data from JSON file or initialize if not present."""
-    if not os.path.exists(DATA_FILE):
-        return {
-            "starting_balance": 0.0,
-            "transactions": []  # list of dicts
-        }
+    """
+    Load data from JSON file or initialize if not present.
+    Transactions logged since the last compaction are replayed on top.
+    """
+    data = {
+        "starting_balance": 0,
+        "transactions": []  # list of dicts
+    }
+
+    if os.path.exists(DATA_FILE):
+        try:
+            data = read_json(DATA_FILE)
+            # basic sanity checks
+            if "starting_balance" not in data:
+                data["starting_balance"] = 0
+            if "transactions" not in data:
+                data["transactions"] = []
+        except (ValueError, OSError):
+            print("⚠️ Data file is corrupted or unreadable. Starting fresh.")
+            data = {
+                "starting_balance": 0,
+                "transactions": []
+            }
+
+    damaged = replay_log(data)
+    upgrade_amounts(data)
+    # Keep transactions sorted by date (stable, so same-day order is kept)
+    data["transactions"].sort(key=_get_date)
+    sync_balance_cache(data)
+    if damaged:
+        # Rewrite now so the next append doesn't land on a cut-off line
+        compact(data)
+    return data
+
+
+def merging_logs() -> List[Tuple[int, str]]:
+    """Return (number, path) of logs renamed by compact(), oldest first."""
+    logs = []
+    for path in glob.glob(LOG_FILE + ".*.merging"):
+        number = path[len(LOG_FILE) + 1:-len(".merging")]
+        if number.isdigit():
+            logs.append((int(number), path))
+    return sorted(logs)
+
+
+def replay_log(data: Dict[str, Any]) -> bool:
+    """
+    Append transactions from the log files (one JSON object per line).
+    Renamed logs already covered by data["log_merged"] are skipped.
+    Returns True if some line could not be decoded (and was skipped).
+    """
+    merged = data.get("log_merged", 0)
+    paths = [path for number, path in merging_logs() if number > merged]
+    paths.append(LOG_FILE)
+
+    loads = orjson.loads if orjson is not None else json.loads
+    damaged = False
+    for path in paths:
+        if not os.path.exists(path):
+            continue
+        with open(path, "rb") as f:
+            for line in f:
+                try:
+                    data["transactions"].append(loads(line))
+                except ValueError:
+                    # Line was cut off by an interrupted write
+                    damaged = True
+    return damaged
+
+
+def upgrade_amounts(data: Dict[str, Any]) -> None:
+    """
+    Convert amounts saved by older versions (float rupees) to int paise.
+    Paise are always written as ints, so any float is an old rupee value.
+    """
+    if isinstance(data["starting_balance"], float):
+        data["starting_balance"] = to_paise(data["starting_balance"])
+        data.pop("cached_balance", None)
+    for t in data["transactions"]:
+        amount = t.get("amount", 0)
+        if not isinstance(amount, int):
+            t["amount"] = to_paise(float(amount))
+            data.pop("cached_balance", None)
 
-    try:
-        with open(DATA_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        # basic sanity checks
-        if "starting_balance" not in data:
-            data["starting_balance"] = 0.0
-        if "transactions" not in data:
-            data["transactions"] = []
-        return data
-    except (json.JSONDecodeError, OSError):
-        print("⚠️ Data file is corrupted or unreadable. Starting fresh.")
-        return {
-            "starting_balance": 0.0,
-            "transactions": []
-        }
+
+def saved_fields(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return data without the in-memory only keys (those starting with '_')."""
+    return {k: v for k, v in data.items() if not k.startswith("_")}
 
 
 def save_data(data: Dict[str, Any]) -> None:
-    """Save data to JSON file."""
-    with open(DATA_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4)
+    """
+    Save data to JSON file (compact, it is not meant to be read by hand).
+    Written to a temp file first so a crash never leaves a half-written file.
+    """
+    tmp = DATA_FILE + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(dumps(saved_fields(data)))
+    os.replace(tmp, DATA_FILE)
+
+
+def append_transaction(transaction: Dict[str, Any]) -> None:
+    """Append a single transaction to the log file."""
+    with open(LOG_FILE, "ab") as f:
+        f.write(dumps(transaction) + b"\n")
+
+
+def compact(data: Dict[str, Any]) -> None:
+    """
+    Write everything to the JSON file and clear the log.
+    The log is first renamed to a numbered '.merging' file and that number is
+    saved as data["log_merged"], so a crash at any step never replays rows twice.
+    """
+    number = max([data.get("log_merged", 0)] + [n for n, _ in merging_logs()]) + 1
+    if os.path.exists(LOG_FILE):
+        os.replace(LOG_FILE, f"{LOG_FILE}.{number}.merging")
+    data["log_merged"] = number
+    save_data(data)
+    for _, path in merging_logs():
+        os.remove(path)
 
 
 # ---------------------- Core Logic ---------------------- #
 
-def calculate_balance(data: Dict[str, Any]) -> float:
-    """Calculate current balance from starting balance and all transactions."""
-    balance = float(data.get("starting_balance", 0.0))
-    for t in data.get("transactions", []):
-        amount = float(t.get("amount", 0.0))
-        if t.get("type") == "IN":
-            balance += amount
-        elif t.get("type") == "OUT":
-            balance -= amount
-    return balance
+def to_paise(amount: float) -> int:
+    """Convert a rupee amount to whole paise."""
+    return int(round(amount * 100))
+
+
+def calculate_balance(data: Dict[str, Any]) -> int:
+    """Calculate current balance (paise) from starting balance and all transactions."""
+    balance = data.get("starting_balance", 0)
+    store = transaction_store(data)
+    income = sum(compress(store.amounts, map("IN".__eq__, store.types)))
+    expense = sum(compress(store.amounts, map("OUT".__eq__, store.types)))
+    return balance + income - expense
+
+
+def sync_balance_cache(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Make sure 'cached_balance' matches the transactions.
+    The cache is trusted if it covers every transaction,
+    otherwise the balance is recomputed once.
+    """
+    count = len(data["transactions"])
+    if "cached_balance" not in data or data.get("cached_count") != count:
+        data["cached_balance"] = calculate_balance(data)
+        data["cached_count"] = count
+    return data
+
+
+class TransactionStore:
+    """
+    Column-wise copy of the transactions: parallel dates/types lists and
+    a packed array of amounts, kept in the same (date-sorted) order.
+    Lets reads scan flat columns instead of looking up keys in every dict.
+    """
+
+    def __init__(self, transactions: List[Dict[str, Any]]) -> None:
+        self.dates: List[str] = list(map(_get_date, transactions))
+        self.types: List[str] = list(map(_get_type, transactions))
+        self.amounts = array("q", map(_get_amount, transactions))
+
+    def add(self, transaction: Dict[str, Any]) -> int:
+        """Insert a transaction after others with the same date; return its index."""
+        index = bisect_right(self.dates, transaction["date"])
+        self.dates.insert(index, transaction["date"])
+        self.types.insert(index, transaction["type"])
+        self.amounts.insert(index, transaction["amount"])
+        return index
+
+
+def transaction_store(data: Dict[str, Any]) -> TransactionStore:
+    """Return the column store for data, building it on first use."""
+    if "_store" not in data:
+        data["_store"] = TransactionStore(data["transactions"])
+    return data["_store"]
+
+
+def next_month_prefix(year: int, month: int) -> str:
+    """Return the 'YYYY-MM' prefix of the month after the given one."""
+    return f"{year + month // 12:04d}-{month % 12 + 1:02d}"
+
+
+def month_totals(
+    data: Dict[str, Any], ym_prefix: str, next_prefix: str
+) -> Tuple[int, int, int, int]:
+    """
+    Return (income, expense, lo, hi) for one month: totals in paise and the
+    slice of data["transactions"] holding that month.
+    Results are memoized per month and number of transactions, so adding a
+    transaction makes old entries unreachable.
+    """
+    key = (ym_prefix, len(data["transactions"]))
+    summaries = data.setdefault("_summaries", {})
+    if key not in summaries:
+        if len(summaries) >= 64:
+            summaries.clear()
+        store = transaction_store(data)
+        # Transactions are sorted by date, so the month is one contiguous slice
+        lo = bisect_left(store.dates, ym_prefix)
+        hi = bisect_left(store.dates, next_prefix)
+        rows = range(lo, hi)
+        income = sum(store.amounts[i] for i in rows if store.types[i] == "IN")
+        expense = sum(store.amounts[i] for i in rows if store.types[i] == "OUT")
+        summaries[key] = (income, expense, lo, hi)
+    return summaries[key]
 
 
 def print_header(title: str) -> None:
@@ -73,15 +278,64 @@ def print_header(title: str) -> None:
     print("=" * 50)
 
 
+_batch_lines: Optional[Iterator[str]] = None
+
+
+def start_batch_mode() -> None:
+    """Read all of stdin up front (used when input is piped, not typed)."""
+    global _batch_lines
+    _batch_lines = iter(sys.stdin.read().splitlines())
+
+
+def ask(prompt: str) -> str:
+    """
+    Read one line of input.
+    In batch mode the line comes from the pre-read stdin and no prompt is shown.
+    """
+    if _batch_lines is None:
+        return input(prompt)
+    line = next(_batch_lines, None)
+    if line is None:
+        raise EOFError
+    return line
+
+
+def write_transaction_rows(transactions: List[Dict[str, Any]]) -> None:
+    """Print one table row per transaction with a single write."""
+    lines = []
+    for t in transactions:
+        ttype = "IN" if t.get("type") == "IN" else "OUT"
+        amount = t.get("amount", 0) / 100
+        sign = "+" if ttype == "IN" else "-"
+        lines.append(
+            f"{t.get('date', ''):<12} {ttype:<4} {sign}{amount:>9.2f}  "
+            f"{t.get('category', ''):<15} {t.get('note', '')}"
+        )
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 def input_float(prompt: str) -> float:
-    """Robust float input."""
+    """Robust float input (rejects nan/inf, which can't be stored as paise)."""
     while True:
-        value = input(prompt).strip()
+        value = ask(prompt).strip()
         try:
             amount = float(value)
-            return amount
+            if math.isfinite(amount):
+                return amount
         except ValueError:
-            print("❌ Invalid number. Try again.")
+            pass
+        print("❌ Invalid number. Try again.")
+
+
+_today_cache: List[Any] = [None, ""]
+
+
+def today_iso() -> str:
+    """Return today's date as YYYY-MM-DD, formatting it only once per day."""
+    today = datetime.today().date()
+    if _today_cache[0] != today:
+        _today_cache[:] = [today, today.isoformat()]
+    return _today_cache[1]
 
 
 def input_date(prompt: str) -> str:
@@ -91,9 +345,9 @@ def input_date(prompt: str) -> str:
     Format: YYYY-MM-DD
     """
     while True:
-        value = input(prompt + " (YYYY-MM-DD, leave empty for today): ").strip()
+        value = ask(prompt + " (YYYY-MM-DD, leave empty for today): ").strip()
         if value == "":
-            return datetime.today().strftime("%Y-%m-%d")
+            return today_iso()
         try:
             datetime.strptime(value, "%Y-%m-%d")
             return value
@@ -105,12 +359,13 @@ def input_date(prompt: str) -> str:
 
 def set_starting_balance(data: Dict[str, Any]) -> None:
     print_header("Set / Update Starting Balance")
-    current = float(data.get("starting_balance", 0.0))
-    print(f"Current starting balance: ₹{current:.2f}")
+    current = data.get("starting_balance", 0)
+    print(f"Current starting balance: ₹{current / 100:.2f}")
     new_balance = input_float("Enter new starting balance (₹): ")
-    data["starting_balance"] = float(new_balance)
-    save_data(data)
-    print(f"✅ Starting balance updated to ₹{new_balance:.2f}")
+    data["starting_balance"] = to_paise(new_balance)
+    data["cached_balance"] += data["starting_balance"] - current
+    compact(data)
+    print(f"✅ Starting balance updated to ₹{data['starting_balance'] / 100:.2f}")
 
 
 def add_income(data: Dict[str, Any]) -> None:
@@ -120,20 +375,23 @@ def add_income(data: Dict[str, Any]) -> None:
         print("❌ Amount must be positive.")
         return
 
-    source = input("Source (e.g., 'From Dad', 'Gift', 'Extra work'): ").strip()
+    source = ask("Source (e.g., 'From Dad', 'Gift', 'Extra work'): ").strip()
     date = input_date("Date")
 
     transaction = {
         "date": date,
         "type": "IN",
-        "amount": amount,
+        "amount": to_paise(amount),
         "category": source if source else "Pocket Money",
-        "note": input("Note (optional): ").strip()
+        "note": ask("Note (optional): ").strip()
     }
 
-    data["transactions"].append(transaction)
-    save_data(data)
-    print(f"✅ Income of ₹{amount:.2f} added.")
+    index = transaction_store(data).add(transaction)
+    data["transactions"].insert(index, transaction)
+    data["cached_balance"] += transaction["amount"]
+    data["cached_count"] += 1
+    append_transaction(transaction)
+    print(f"✅ Income of ₹{transaction['amount'] / 100:.2f} added.")
 
 
 def add_expense(data: Dict[str, Any]) -> None:
@@ -143,7 +401,7 @@ def add_expense(data: Dict[str, Any]) -> None:
         print("❌ Amount must be positive.")
         return
 
-    category = input("Category (e.g., 'Snacks', 'Movies', 'Games'): ").strip()
+    category = ask("Category (e.g., 'Snacks', 'Movies', 'Games'): ").strip()
     if not category:
         category = "Other"
 
@@ -152,21 +410,24 @@ def add_expense(data: Dict[str, Any]) -> None:
     transaction = {
         "date": date,
         "type": "OUT",
-        "amount": amount,
+        "amount": to_paise(amount),
         "category": category,
-        "note": input("Note (optional): ").strip()
+        "note": ask("Note (optional): ").strip()
     }
 
-    data["transactions"].append(transaction)
-    save_data(data)
-    print(f"✅ Expense of ₹{amount:.2f} added.")
+    index = transaction_store(data).add(transaction)
+    data["transactions"].insert(index, transaction)
+    data["cached_balance"] -= transaction["amount"]
+    data["cached_count"] += 1
+    append_transaction(transaction)
+    print(f"✅ Expense of ₹{transaction['amount'] / 100:.2f} added.")
 
 
 def show_balance(data: Dict[str, Any]) -> None:
     print_header("Current Balance")
-    balance = calculate_balance(data)
-    print(f"💰 Current balance: ₹{balance:.2f}")
-    print(f"📌 Starting balance: ₹{float(data.get('starting_balance', 0.0)):.2f}")
+    balance = data["cached_balance"]
+    print(f"💰 Current balance: ₹{balance / 100:.2f}")
+    print(f"📌 Starting balance: ₹{data.get('starting_balance', 0) / 100:.2f}")
     print(f"🧾 Total transactions: {len(data.get('transactions', []))}")
 
 
@@ -178,32 +439,23 @@ def list_transactions(data: Dict[str, Any]) -> None:
         print("No transactions yet.")
         return
 
-    # Sort by date
-    transactions_sorted = sorted(transactions, key=lambda x: x.get("date", ""))
-
+    # Already sorted by date (see load_data / TransactionStore.add)
     print(f"{'Date':<12} {'Type':<4} {'Amount':>10}  {'Category':<15} Note")
     print("-" * 70)
-    for t in transactions_sorted:
-        date = t.get("date", "")
-        ttype = "IN" if t.get("type") == "IN" else "OUT"
-        amount = float(t.get("amount", 0.0))
-        category = t.get("category", "")
-        note = t.get("note", "")
-        sign = "+" if ttype == "IN" else "-"
-        print(f"{date:<12} {ttype:<4} {sign}{amount:>9.2f}  {category:<15} {note}")
+    write_transaction_rows(transactions)
 
 
 def monthly_summary(data: Dict[str, Any]) -> None:
     print_header("Monthly Summary")
 
-    year = input("Enter year (YYYY, leave empty for current year): ").strip()
-    month = input("Enter month (MM, leave empty for current month): ").strip()
+    year = ask("Enter year (YYYY, leave empty for current year): ").strip()
+    month = ask("Enter month (MM, leave empty for current month): ").strip()
 
-    today = datetime.today()
+    today = today_iso()
     if year == "":
-        year = today.strftime("%Y")
+        year = today[:4]
     if month == "":
-        month = today.strftime("%m")
+        month = today[5:7]
 
     # Validate year, month
     try:
@@ -214,39 +466,29 @@ def monthly_summary(data: Dict[str, Any]) -> None:
 
     ym_prefix = f"{year}-{month:>02}" if len(month) == 2 else f"{year}-0{month}"
 
-    income_total = 0.0
-    expense_total = 0.0
-    counted_transactions = []
-
-    for t in data.get("transactions", []):
-        date = t.get("date", "")
-        if not date.startswith(ym_prefix):
-            continue
-        amount = float(t.get("amount", 0.0))
-        if t.get("type") == "IN":
-            income_total += amount
-        elif t.get("type") == "OUT":
-            expense_total += amount
-        counted_transactions.append(t)
+    income_total, expense_total, lo, hi = month_totals(
+        data, ym_prefix, next_month_prefix(int(year), int(month))
+    )
+    counted_transactions = data["transactions"][lo:hi]
 
     print(f"\nSummary for {year}-{month}:")
-    print(f" - Total Income : ₹{income_total:.2f}")
-    print(f" - Total Expense: ₹{expense_total:.2f}")
-    print(f" - Net Change   : ₹{(income_total - expense_total):.2f}")
+    print(f" - Total Income : ₹{income_total / 100:.2f}")
+    print(f" - Total Expense: ₹{expense_total / 100:.2f}")
+    print(f" - Net Change   : ₹{(income_total - expense_total) / 100:.2f}")
     print(f" - Transactions : {len(counted_transactions)}")
 
     if counted_transactions:
         print("\nDetails:")
         print(f"{'Date':<12} {'Type':<4} {'Amount':>10}  {'Category':<15} Note")
         print("-" * 70)
-        for t in sorted(counted_transactions, key=lambda x: x.get("date", "")):
-            date = t.get("date", "")
-            ttype = t.get("type")
-            amount = float(t.get("amount", 0.0))
-            category = t.get("category", "")
-            note = t.get("note", "")
-            sign = "+" if ttype == "IN" else "-"
-            print(f"{date:<12} {ttype:<4} {sign}{amount:>9.2f}  {category:<15} {note}")
+        write_transaction_rows(counted_transactions)
+
+
+def export_pretty(data: Dict[str, Any]) -> None:
+    print_header("Export Pretty JSON")
+    with open(PRETTY_FILE, "w", encoding="utf-8") as f:
+        json.dump(saved_fields(data), f, indent=2, ensure_ascii=False)
+    print(f"✅ Data exported to '{PRETTY_FILE}'.")
 
 
 # ---------------------- Main Menu ---------------------- #
@@ -261,33 +503,47 @@ def print_menu() -> None:
     print("4) Show current balance")
     print("5) Show all transactions")
     print("6) Show monthly summary")
+    print("7) Export pretty JSON")
     print("0) Exit")
 
 
 def main() -> None:
     data = load_data()
 
-    while True:
-        print_menu()
-        choice = input("Choose an option: ").strip()
-
-        if choice == "1":
-            set_starting_balance(data)
-        elif choice == "2":
-            add_income(data)
-        elif choice == "3":
-            add_expense(data)
-        elif choice == "4":
-            show_balance(data)
-        elif choice == "5":
-            list_transactions(data)
-        elif choice == "6":
-            monthly_summary(data)
-        elif choice == "0":
-            print("👋 Goodbye! Keep tracking your money wisely.")
-            break
-        else:
-            print("❌ Invalid choice. Try again.")
+    # Piped input (e.g. a batch import script) is read in one go
+    batch = not sys.stdin.isatty()
+    if batch:
+        start_batch_mode()
+
+    try:
+        while True:
+            if not batch:
+                print_menu()
+            choice = ask("Choose an option: ").strip()
+
+            if choice == "1":
+                set_starting_balance(data)
+            elif choice == "2":
+                add_income(data)
+            elif choice == "3":
+                add_expense(data)
+            elif choice == "4":
+                show_balance(data)
+            elif choice == "5":
+                list_transactions(data)
+            elif choice == "6":
+                monthly_summary(data)
+            elif choice == "7":
+                export_pretty(data)
+            elif choice == "0":
+                compact(data)
+                print("👋 Goodbye! Keep tracking your money wisely.")
+                break
+            else:
+                print("❌ Invalid choice. Try again.")
+    except EOFError:
+        # Input ran out (end of piped input or Ctrl-D): still merge the log
+        compact(data)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,8 @@
+import io
 import streamlit as st
+import numpy as np
 import pandas as pd
+from pandas.api.types import CategoricalDtype
 from datetime import datetime
 
 # -----------------------------
@@ -18,15 +21,62 @@ st.write("Track your pocket money, savings, and daily expenses in a simple way."
 # -----------------------------
 # INITIALIZE SESSION STATE
 # -----------------------------
+TYPE_DTYPE = CategoricalDtype(["Income (+)", "Expense (-)"])
+
+
+def _with_dtypes(df):
+    """Keep Date as datetime64, Amount as int64 paise and Type/Category as categoricals."""
+    df["Date"] = df["Date"].astype("datetime64[ns]")
+    df["Amount"] = df["Amount"].astype(np.int64)
+    df["Type"] = df["Type"].astype(TYPE_DTYPE)
+    df["Category"] = df["Category"].astype("category")
+    return df
+
+
 if "transactions" not in st.session_state:
-    st.session_state.transactions = pd.DataFrame(
+    st.session_state.transactions = _with_dtypes(pd.DataFrame(
         columns=["Date", "Type", "Amount", "Category", "Note"]
-    )
+    ))
 
 if "starting_balance" not in st.session_state:
     st.session_state.starting_balance = 0.0
 
 
+def _append_row(df, row):
+    """
+    Append one row to the transactions DataFrame.
+    The new row gets exactly df's dtypes (adding its category if it is new),
+    so the concat keeps the categoricals instead of falling back to object.
+    """
+    if row["Category"] not in df["Category"].cat.categories:
+        df["Category"] = df["Category"].cat.add_categories([row["Category"]])
+    new = _with_dtypes(pd.DataFrame([row]))
+    new["Category"] = new["Category"].astype(df["Category"].dtype)
+    return pd.concat([df, new], ignore_index=True)
+
+
+# Chart data only changes when the transactions (or starting balance) do,
+# so it is cached instead of recomputed on every widget interaction.
+@st.cache_data(show_spinner=False, max_entries=8)
+def _balance_over_time(df, starting_balance):
+    """Running balance in rupees, indexed by date."""
+    df_chart = df.copy()
+    sign = np.where((df_chart["Type"] == "Income (+)").to_numpy(), 1, -1)
+    df_chart["Signed_Amount"] = sign * df_chart["Amount"].to_numpy()
+
+    # Daily balance over time
+    df_chart = df_chart.sort_values("Date")
+    df_chart["Cumulative"] = starting_balance + df_chart["Signed_Amount"].cumsum() / 100
+    return df_chart.set_index("Date")["Cumulative"]
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _expenses_by_category(df):
+    """Total expenses in rupees per category."""
+    df_exp = df[(df["Type"] == "Expense (-)").to_numpy()]
+    return df_exp.groupby("Category", observed=True)["Amount"].sum() / 100
+
+
 # -----------------------------
 # SIDEBAR SETTINGS
 # -----------------------------
@@ -51,22 +101,37 @@ uploaded_file = st.sidebar.file_uploader(
 
 if uploaded_file is not None:
     try:
-        df_uploaded = pd.read_csv(uploaded_file)
+        # Read text columns as strings, so numeric-looking notes don't end up
+        # mixed with later text entries (Parquet can't write mixed columns)
+        df_uploaded = pd.read_csv(uploaded_file, dtype={"Category": str, "Note": str})
         # Basic validation
         required_cols = {"Date", "Type", "Amount", "Category", "Note"}
-        if required_cols.issubset(set(df_uploaded.columns)):
-            st.session_state.transactions = df_uploaded
-            st.sidebar.success("Transactions loaded successfully!")
-        else:
+        if not required_cols.issubset(set(df_uploaded.columns)):
             st.sidebar.error("CSV does not have the required columns.")
+        elif (~df_uploaded["Type"].isin(TYPE_DTYPE.categories)).any():
+            st.sidebar.error(
+                "CSV has unknown values in 'Type' "
+                "(expected 'Income (+)' or 'Expense (-)')."
+            )
+        else:
+            df_uploaded["Date"] = pd.to_datetime(
+                df_uploaded["Date"], format="%Y-%m-%d", cache=True
+            )
+            df_uploaded["Category"] = df_uploaded["Category"].fillna("Uncategorized")
+            df_uploaded["Note"] = df_uploaded["Note"].fillna("")
+            # CSV amounts are in rupees; keep them as whole paise
+            amount = pd.to_numeric(df_uploaded["Amount"], errors="coerce").fillna(0)
+            df_uploaded["Amount"] = (amount * 100).round().astype(np.int64)
+            st.session_state.transactions = _with_dtypes(df_uploaded)
+            st.sidebar.success("Transactions loaded successfully!")
     except Exception as e:
         st.sidebar.error(f"Error reading file: {e}")
 
 # Reset data button
 if st.sidebar.button("Reset All Data"):
-    st.session_state.transactions = pd.DataFrame(
+    st.session_state.transactions = _with_dtypes(pd.DataFrame(
         columns=["Date", "Type", "Amount", "Category", "Note"]
-    )
+    ))
     st.sidebar.success("All data cleared!")
 
 
@@ -97,16 +162,15 @@ with st.form("add_transaction_form", clear_on_submit=True):
             category = "Uncategorized"
 
         new_row = {
-            "Date": date.strftime("%Y-%m-%d"),
+            "Date": pd.Timestamp(date),
             "Type": t_type,
-            "Amount": amount,
+            "Amount": int(round(amount * 100)),
             "Category": category,
             "Note": note,
         }
 
-        st.session_state.transactions = pd.concat(
-            [st.session_state.transactions, pd.DataFrame([new_row])],
-            ignore_index=True
+        st.session_state.transactions = _append_row(
+            st.session_state.transactions, new_row
         )
         st.success("Entry added!")
 
@@ -119,11 +183,12 @@ st.subheader("📊 Summary")
 df = st.session_state.transactions.copy()
 
 if not df.empty:
-    # Convert Amount to numeric just in case
-    df["Amount"] = pd.to_numeric(df["Amount"], errors="coerce").fillna(0)
+    is_income = (df["Type"] == "Income (+)").to_numpy()
+    is_expense = (df["Type"] == "Expense (-)").to_numpy()
 
-    total_income = df.loc[df["Type"] == "Income (+)", "Amount"].sum()
-    total_expense = df.loc[df["Type"] == "Expense (-)", "Amount"].sum()
+    # Amounts are in paise; convert to rupees for display
+    total_income = df.loc[is_income, "Amount"].sum() / 100
+    total_expense = df.loc[is_expense, "Amount"].sum() / 100
     current_balance = st.session_state.starting_balance + total_income - total_expense
 else:
     total_income = 0.0
@@ -145,23 +210,33 @@ if df.empty:
     st.info("No transactions yet. Add your first entry above.")
 else:
     # Sort by date
-    df_display = df.copy()
-    df_display["Date"] = pd.to_datetime(df_display["Date"])
-    df_display = df_display.sort_values("Date", ascending=False)
+    df_display = df.sort_values("Date", ascending=False)
+    df_display["Amount"] = df_display["Amount"] / 100
 
     st.dataframe(df_display, use_container_width=True)
 
     # -------------------------
-    # DOWNLOAD DATA AS CSV
+    # DOWNLOAD DATA
     # -------------------------
-    csv_data = df_display.to_csv(index=False).encode("utf-8")
+    parquet_buf = io.BytesIO()
+    df_display.to_parquet(parquet_buf, engine="pyarrow", compression="zstd", index=False)
     st.download_button(
-        label="Download as CSV",
-        data=csv_data,
-        file_name="pocket_money_transactions.csv",
-        mime="text/csv",
+        label="Download as Parquet",
+        data=parquet_buf.getvalue(),
+        file_name="pocket_money_transactions.parquet",
+        mime="application/octet-stream",
     )
 
+    # CSV is slower to build, so only do it when asked for
+    if st.button("Prepare CSV download"):
+        csv_data = df_display.to_csv(index=False).encode("utf-8")
+        st.download_button(
+            label="Download as CSV",
+            data=csv_data,
+            file_name="pocket_money_transactions.csv",
+            mime="text/csv",
+        )
+
 
 # -----------------------------
 # SIMPLE ANALYTICS (OPTIONAL)
@@ -169,26 +244,11 @@ else:
 if not df.empty:
     st.subheader("📈 Simple Charts")
 
-    # Ensure proper types
-    df_chart = df.copy()
-    df_chart["Date"] = pd.to_datetime(df_chart["Date"])
-    df_chart["Signed_Amount"] = df_chart.apply(
-        lambda row: row["Amount"] if row["Type"] == "Income (+)" else -row["Amount"],
-        axis=1,
-    )
-
-    # Daily balance over time
-    df_chart = df_chart.sort_values("Date")
-    df_chart["Cumulative"] = (
-        st.session_state.starting_balance + df_chart["Signed_Amount"].cumsum()
-    )
-
     st.markdown("**Balance Over Time**")
-    st.line_chart(df_chart.set_index("Date")["Cumulative"])
+    st.line_chart(_balance_over_time(df, st.session_state.starting_balance))
 
     # Spending by category (only expenses)
-    df_exp = df[df["Type"] == "Expense (-)"]
-    if not df_exp.empty:
-        df_cat = df_exp.groupby("Category")["Amount"].sum().reset_index()
+    df_cat = _expenses_by_category(df)
+    if not df_cat.empty:
         st.markdown("**Expenses by Category**")
-        st.bar_chart(df_cat.set_index("Category")["Amount"])
+        st.bar_chart(df_cat)
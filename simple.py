@@ -7,38 +7,75 @@ Features:
 - Add expense
 - Show balance
 - Show history
+- Export a readable (pretty) JSON copy
 
 Data is stored in 'pocket_money_data.json' in the same folder.
+New entries go to 'pocket_money_data.log' until you exit.
 No fancy stuff. Just works.
 """
 
 import json
 import os
+import sys
 from datetime import datetime
 
 DATA_FILE = "pocket_money_data.json"
+LOG_FILE = "pocket_money_data.log"
+PRETTY_FILE = "pocket_money_data.pretty.json"
 
 
 # ---------- Data Handling ---------- #
 
 def load_data():
-    """Load existing data or create a new structure."""
-    if not os.path.exists(DATA_FILE):
-        return {
-            "transactions": []  # each: {date, type, amount, note}
-        }
-    try:
-        with open(DATA_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
-        print("Data file corrupted. Starting fresh.")
-        return {"transactions": []}
+    """Load existing data (plus logged transactions) or create a new structure."""
+    data = {"transactions": []}  # each: {date, type, amount, note}
+    if os.path.exists(DATA_FILE):
+        try:
+            with open(DATA_FILE, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (ValueError, OSError):
+            print("Data file corrupted. Starting fresh.")
+            data = {"transactions": []}
+    damaged = replay_log(data)
+    sync_balance_cache(data)
+    if damaged:
+        compact(data)  # so the next append doesn't land on a cut-off line
+    return data
+
+
+def replay_log(data):
+    """Add transactions from the log file; return True if a line was unreadable."""
+    if not os.path.exists(LOG_FILE):
+        return False
+    damaged = False
+    with open(LOG_FILE, "rb") as f:
+        for line in f:
+            try:
+                data["transactions"].append(json.loads(line))
+            except ValueError:
+                damaged = True  # cut-off line from an interrupted write
+    return damaged
 
 
 def save_data(data):
-    """Save data to JSON file."""
-    with open(DATA_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4)
+    """Save data to JSON file (via a temp file, so a crash can't truncate it)."""
+    tmp = DATA_FILE + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, separators=(",", ":"))
+    os.replace(tmp, DATA_FILE)
+
+
+def append_transaction(transaction):
+    """Append one transaction to the log file."""
+    with open(LOG_FILE, "a", encoding="utf-8") as f:
+        f.write(json.dumps(transaction, separators=(",", ":")) + "\n")
+
+
+def compact(data):
+    """Write everything to the JSON file and clear the log."""
+    save_data(data)
+    if os.path.exists(LOG_FILE):
+        os.remove(LOG_FILE)
 
 
 # ---------- Core Logic ---------- #
@@ -55,6 +92,15 @@ def calc_balance(data):
     return balance
 
 
+def sync_balance_cache(data):
+    """Recompute the cached balance unless it already covers every transaction."""
+    count = len(data["transactions"])
+    if "cached_balance" not in data or data.get("cached_count") != count:
+        data["cached_balance"] = calc_balance(data)
+        data["cached_count"] = count
+    return data
+
+
 def input_float(prompt):
     """Force user to enter a valid number."""
     while True:
@@ -82,7 +128,9 @@ def add_income(data):
         "note": note
     }
     data["transactions"].append(transaction)
-    save_data(data)
+    data["cached_balance"] += amount
+    data["cached_count"] += 1
+    append_transaction(transaction)
     print("Income added.")
 
 
@@ -102,13 +150,22 @@ def add_expense(data):
         "note": note
     }
     data["transactions"].append(transaction)
-    save_data(data)
+    data["cached_balance"] -= amount
+    data["cached_count"] += 1
+    append_transaction(transaction)
     print("Expense added.")
 
 
+def export_pretty(data):
+    print("\n--- Export Pretty JSON ---")
+    with open(PRETTY_FILE, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    print(f"Exported to {PRETTY_FILE}.")
+
+
 def show_balance(data):
     print("\n--- Current Balance ---")
-    balance = calc_balance(data)
+    balance = data["cached_balance"]
     print(f"Balance: ₹{balance:.2f}")
     print(f"Total entries: {len(data['transactions'])}")
 
@@ -121,10 +178,12 @@ def show_history(data):
 
     print(f"{'Date':<17} {'Type':<6} {'Amount':>10}  Note")
     print("-" * 50)
+    lines = []
     for t in data["transactions"]:
         t_type = "IN" if t["type"] == "IN" else "OUT"
         sign = "+" if t_type == "IN" else "-"
-        print(f"{t['date']:<17} {t_type:<6} {sign}{t['amount']:>9.2f}  {t['note']}")
+        lines.append(f"{t['date']:<17} {t_type:<6} {sign}{t['amount']:>9.2f}  {t['note']}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # ---------- Menu ---------- #
@@ -137,6 +196,7 @@ def print_menu():
     print("2) Add expense")
     print("3) Show balance")
     print("4) Show history")
+    print("5) Export pretty JSON")
     print("0) Exit")
 
 
@@ -155,7 +215,10 @@ def main():
             show_balance(data)
         elif choice == "4":
             show_history(data)
+        elif choice == "5":
+            export_pretty(data)
         elif choice == "0":
+            compact(data)
             print("Exiting. Track your money like an adult.")
             break
         else: